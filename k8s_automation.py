@@ -1,162 +1,382 @@
+import asyncio
+import logging
 import subprocess
 import yaml
-import json
-from kubernetes import client, config
-from kubernetes.client.rest import ApiException
+import orjson
+import functools
+import fastjsonschema
+from cachetools import TTLCache
+from typing import Dict, Any
+
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml, ~10x faster than pure Python
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    from ruamel.yaml import YAML as _RuamelYAML
+    from ruamel.yaml.error import YAMLError as _RuamelYAMLError
+
+    # typ='safe' with pure=False uses ruamel's C extension; KEDA configs are
+    # plain mappings, so duplicate keys are rejected rather than silently
+    # last-one-wins as with yaml.safe_load.
+    _YAML = _RuamelYAML(typ='safe', pure=False)
+    _YAML.allow_duplicate_keys = False
+    _YAML_ERRORS = (yaml.YAMLError, _RuamelYAMLError)
+
+    def _load_yaml(data: bytes) -> Any:
+        return _YAML.load(data)
+except ImportError:
+    _YAML_ERRORS = (yaml.YAMLError,)
+
+    def _load_yaml(data: bytes) -> Any:
+        return yaml.load(data, Loader=_YamlLoader)
+from kubernetes_asyncio import client, config, watch
+from kubernetes_asyncio.client import rest
+from kubernetes_asyncio.client.rest import ApiException
+
+# The rest client serializes every request body with stdlib json.dumps — its
+# only use of the json module — and aiohttp accepts bytes request data, so
+# pointing that name at orjson routes all body encoding through the C encoder.
+# The typed API surface offers no way to pass pre-encoded bytes for JSON
+# content types, which rules out doing this per call site.
+rest.json = orjson
 import sys
 import os
-from typing import Dict, Any
+import time
+
+logger = logging.getLogger(__name__)
+
+_CONFIG_SCHEMA = {
+    "type": "object",
+    "required": ["deployment_name", "namespace", "image", "tag", "cpu_request", "cpu_limit",
+                 "memory_request", "memory_limit", "port", "min_replicas", "max_replicas",
+                 "scaler_type", "scaler_config"],
+    "properties": {
+        "deployment_name": {"type": "string"},
+        "namespace": {"type": "string"},
+        "image": {"type": "string"},
+        "tag": {"type": "string"},
+        "cpu_request": {"type": "string"},
+        "cpu_limit": {"type": "string"},
+        "memory_request": {"type": "string"},
+        "memory_limit": {"type": "string"},
+        "port": {"type": "integer", "minimum": 1, "maximum": 65535},
+        "min_replicas": {"type": "integer", "minimum": 0},
+        "max_replicas": {"type": "integer", "minimum": 1},
+        "scaler_type": {"type": "string"},
+        "scaler_config": {"type": "object"},
+        "env_vars": {"type": "object"},
+        "readiness_webhook_url": {"type": "string"}
+    }
+}
+
+# Code-generated once at import time: fastjsonschema compiles the schema into
+# a plain Python function, so per-call validation is a straight-line check
+# instead of a schema-tree walk.
+_validate_config = fastjsonschema.compile(_CONFIG_SCHEMA)
+
+@functools.lru_cache(maxsize=64)
+def _parse_config(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a deployment config file; mtime/size key the cache so edits invalidate the entry."""
+    with open(path, 'rb') as f:
+        return _load_yaml(f.read())
+
+def _load_config(path: str) -> Dict[str, Any]:
+    """Return the parsed config for path, cached across calls until the file changes on disk."""
+    st = os.stat(path)
+    return _parse_config(path, st.st_mtime_ns, st.st_size)
+
+# Hot string constants, interned once so every deployment body and selector in
+# a long-lived process shares a single copy instead of accumulating duplicates.
+_APP_KEY = sys.intern("app")
+_RUNNING = sys.intern("Running")
+
+async def _checked(call, ignore: tuple = ()):
+    """Await a _preload_content=False API call and raise ApiException on error.
+
+    kubernetes_asyncio only raises for HTTP status inside its body-preloading
+    path; raw calls return the plain aiohttp response no matter the status, so
+    failures must be surfaced by hand. Statuses listed in ignore are returned
+    to the caller instead of raised.
+    """
+    resp = await call
+    if not 200 <= resp.status < 300 and resp.status not in ignore:
+        raise ApiException(http_resp=rest.RESTResponse(resp, await resp.read()))
+    return resp
+
+_API_CLIENTS: Dict[tuple, client.ApiClient] = {}
+
+async def _api_client_for(kubeconfig_path: str, mtime_ns: int) -> client.ApiClient:
+    """Build an ApiClient for a kubeconfig, cached per (path, mtime).
+
+    Repeated connect() calls in one process reuse the parsed kubeconfig, auth
+    token and aiohttp connection pool instead of paying TLS setup and a YAML
+    parse each time; editing the kubeconfig invalidates the entry via the
+    mtime key. (A plain dict rather than lru_cache because the loader is a
+    coroutine.)
+    """
+    key = (kubeconfig_path, mtime_ns)
+    api_client = _API_CLIENTS.get(key)
+    if api_client is None:
+        # One open+read, parsed with the libyaml loader; load_kube_config would
+        # otherwise stat and read the file again with the pure-Python parser
+        with open(kubeconfig_path, 'rb') as f:
+            cfg_dict = _load_yaml(f.read())
+        cfg = client.Configuration()
+        await config.load_kube_config_from_dict(cfg_dict, client_configuration=cfg)
+        # Enough warm keep-alive connections for the concurrent create/health
+        # calls without re-handshaking TLS per request
+        cfg.connection_pool_maxsize = 16
+        api_client = _API_CLIENTS[key] = client.ApiClient(configuration=cfg)
+    return api_client
+
+async def _close_api_client(api_client: client.ApiClient) -> None:
+    """Close an ApiClient and evict it from the kubeconfig cache.
+
+    Closing a cached client without evicting it would hand the next connect()
+    a client whose aiohttp session is already closed. Cached clients are also
+    bound to the event loop that created them, so entries must not survive
+    into a later asyncio.run() invocation either way.
+    """
+    for key, cached in list(_API_CLIENTS.items()):
+        if cached is api_client:
+            del _API_CLIENTS[key]
+    await api_client.close()
+
+@functools.lru_cache(maxsize=128)
+def _build_deployment_body(name: str, namespace: str, image: str, tag: str,
+                           cpu_request: str, cpu_limit: str, memory_request: str,
+                           memory_limit: str, port: int, replicas: int,
+                           env_items: tuple) -> Dict[str, Any]:
+    """Assemble a deployment body, memoized on the full field fingerprint.
+
+    Plain dicts rather than client.V1* models: the client serializes models
+    back to JSON anyway, so raw dicts skip the reflective sanitize step on
+    the way out as well as the object tree on the way in. Every field that
+    varies is part of the cache key, so the cached body can be reused as-is —
+    the create call only serializes it and never mutates it.
+    """
+    # One shared, interned label dict serves the selector and the pod template
+    labels = {_APP_KEY: sys.intern(name)}
+    return {
+        "apiVersion": "apps/v1",
+        "kind": "Deployment",
+        "metadata": {"name": name, "namespace": namespace},
+        "spec": {
+            "replicas": replicas,
+            "selector": {"matchLabels": labels},
+            "template": {
+                "metadata": {"labels": labels},
+                "spec": {
+                    "containers": [
+                        {
+                            "name": name,
+                            "image": f"{image}:{tag}",
+                            "ports": [{"containerPort": port}],
+                            "resources": {
+                                "requests": {"cpu": cpu_request, "memory": memory_request},
+                                "limits": {"cpu": cpu_limit, "memory": memory_limit}
+                            },
+                            "env": [{"name": k, "value": v} for k, v in env_items]
+                        }
+                    ]
+                }
+            }
+        }
+    }
+
+@functools.lru_cache(maxsize=128)
+def _build_service_body(name: str, namespace: str, port: int) -> Dict[str, Any]:
+    """Assemble the ClusterIP service for a deployment, memoized like the deployment body."""
+    return {
+        "apiVersion": "v1",
+        "kind": "Service",
+        "metadata": {"name": f"{name}-service", "namespace": namespace},
+        "spec": {
+            "selector": {_APP_KEY: sys.intern(name)},
+            "ports": [{"port": port, "targetPort": port}],
+            "type": "ClusterIP"
+        }
+    }
 
 class KubernetesAutomation:
     """A class to automate Kubernetes operations including KEDA installation and deployment management."""
 
-    def __init__(self, kubeconfig_path: str = None):
-        """Initialize Kubernetes client with optional kubeconfig path."""
+    def __init__(self, api_client: client.ApiClient):
+        """Wrap an already-configured ApiClient; use connect() to build one."""
+        # One shared ApiClient keeps a single aiohttp connection pool across all handles
+        self.api_client = api_client
+        self.core_v1 = client.CoreV1Api(api_client=api_client)
+        self.apps_v1 = client.AppsV1Api(api_client=api_client)
+        self.custom_objects_api = client.CustomObjectsApi(api_client=api_client)
+        # Health results keyed by deployment resourceVersion; the TTL bounds
+        # staleness for pod churn that doesn't bump the deployment object
+        self._health_cache = TTLCache(maxsize=256, ttl=2)
+
+    @classmethod
+    async def connect(cls, kubeconfig_path: str = None) -> "KubernetesAutomation":
+        """Load the Kubernetes config (kubeconfig or in-cluster) and return a connected instance."""
         try:
-            if kubeconfig_path and os.path.exists(kubeconfig_path):
-                config.load_kube_config(config_file=kubeconfig_path)
-            else:
+            api_client = None
+            if kubeconfig_path:
+                # A single stat both probes existence and keys the client cache;
+                # the old os.path.exists check duplicated the syscall
+                try:
+                    st = os.stat(kubeconfig_path)
+                    api_client = await _api_client_for(kubeconfig_path, st.st_mtime_ns)
+                except FileNotFoundError:
+                    pass
+            if api_client is None:
                 config.load_incluster_config()  # Fallback for in-cluster execution
-            self.core_v1 = client.CoreV1Api()
-            self.apps_v1 = client.AppsV1Api()
-            self.custom_objects_api = client.CustomObjectsApi()
-            print("Successfully connected to Kubernetes cluster")
+                cfg = client.Configuration.get_default_copy()
+                cfg.connection_pool_maxsize = 16
+                api_client = client.ApiClient(configuration=cfg)
+            logger.info("Successfully connected to Kubernetes cluster")
+            return cls(api_client)
         except Exception as e:
-            print(f"Error connecting to Kubernetes cluster: {str(e)}")
+            logger.error("Error connecting to Kubernetes cluster: %s", e)
             sys.exit(1)
 
-    def install_helm(self) -> bool:
+    @staticmethod
+    async def _sh(*cmd: str) -> bytes:
+        """Run a command without blocking the event loop and return its stdout.
+
+        Raises subprocess.CalledProcessError (with decoded stderr) on a
+        non-zero exit so existing helm error handling keeps working.
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await proc.communicate()
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd,
+                                                output=stdout, stderr=stderr.decode())
+        return stdout
+
+    async def install_helm(self) -> bool:
         """Install Helm if not present and verify installation."""
         try:
-            result = subprocess.run(
-                ["helm", "version", "--short"],
-                capture_output=True, text=True, check=True
-            )
-            print(f"Helm already installed: {result.stdout.strip()}")
+            # A hung PATH entry shouldn't stall the CLI, so cap the probe at 2s
+            stdout = await asyncio.wait_for(self._sh("helm", "version", "--short"), timeout=2)
+            logger.info("Helm already installed: %s", stdout.decode().strip())
             return True
-        except subprocess.CalledProcessError:
-            print("Helm not found. Please install Helm manually or ensure it's in PATH.")
+        except asyncio.TimeoutError:
+            logger.error("'helm version' did not respond within 2s")
+            return False
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            logger.error("Helm not found. Please install Helm manually or ensure it's in PATH.")
             return False
         except Exception as e:
-            print(f"Error checking Helm installation: {str(e)}")
+            logger.error("Error checking Helm installation: %s", e)
+            return False
+
+    _HELM_REPO_CONFIG = os.path.expanduser("~/.config/helm/repositories.yaml")
+    _HELM_REPO_CACHE = os.path.expanduser("~/.cache/helm/repository/kedacore-index.yaml")
+
+    def _keda_repo_is_fresh(self) -> bool:
+        """Return True if the kedacore Helm repo is already added and its index is under an hour old."""
+        try:
+            with open(self._HELM_REPO_CONFIG, 'rb') as f:
+                repos = _load_yaml(f.read()) or {}
+            if not any(r.get('name') == 'kedacore' for r in repos.get('repositories', [])):
+                return False
+            return time.time() - os.stat(self._HELM_REPO_CACHE).st_mtime < 3600
+        except (OSError,) + _YAML_ERRORS:
             return False
 
-    def install_keda(self, namespace: str = "keda") -> bool:
+    async def _ensure_namespace(self, namespace: str) -> None:
+        """Idempotently ensure a namespace exists with a single round trip.
+
+        An unconditional create that swallows 409 AlreadyExists replaces the
+        old read-then-create dance, which cost two round trips on the cold
+        path and raced concurrent creators.
+        """
+        # 409 AlreadyExists is the expected warm-path outcome; anything else
+        # non-2xx (RBAC, validation) is raised by _checked so callers don't
+        # proceed against a namespace that was never created.
+        resp = await _checked(self.core_v1.create_namespace(
+            {"apiVersion": "v1", "kind": "Namespace", "metadata": {"name": namespace}},
+            _preload_content=False
+        ), ignore=(409,))
+        if resp.status != 409:
+            logger.info("Created namespace: %s", namespace)
+
+    async def _refresh_keda_repo(self) -> None:
+        """Add/refresh the KEDA Helm repository only when the local index is
+        missing or stale; each helm subprocess costs fork+exec plus Go runtime
+        startup, so skip both calls on the warm path."""
+        if not self._keda_repo_is_fresh():
+            await self._sh("helm", "repo", "add", "kedacore",
+                           "https://kedacore.github.io/charts", "--force-update")
+            await self._sh("helm", "repo", "update", "kedacore")
+
+    async def install_keda(self, namespace: str = "keda") -> bool:
         """Install KEDA using Helm and verify the operator is running."""
         try:
-            # Add KEDA Helm repository
-            subprocess.run(["helm", "repo", "add", "kedacore", "https://kedacore.github.io/charts"], check=True)
-            subprocess.run(["helm", "repo", "update"], check=True)
+            # The repo refresh (helm subprocesses) and the namespace ensure
+            # (apiserver round trip) are independent, so overlap them.
+            await asyncio.gather(self._refresh_keda_repo(), self._ensure_namespace(namespace))
 
-            # Create namespace if it doesn't exist
-            try:
-                self.core_v1.read_namespace(name=namespace)
-            except ApiException as e:
-                if e.status == 404:
-                    namespace_body = client.V1Namespace(metadata=client.V1ObjectMeta(name=namespace))
-                    self.core_v1.create_namespace(namespace_body)
-                    print(f"Created namespace: {namespace}")
-                else:
-                    raise e
-
-            # Install KEDA Helm chart
-            subprocess.run(
-                ["helm", "install", "keda", "kedacore/keda", "--namespace", namespace, "--create-namespace"],
-                check=True
+            # Install (or upgrade) the KEDA Helm chart in a single idempotent
+            # invocation; --atomic rolls back a failed install, and --output json
+            # gives us the release status without shelling out again to verify.
+            stdout = await self._sh(
+                "helm", "upgrade", "--install", "keda", "kedacore/keda",
+                "--namespace", namespace, "--create-namespace", "--wait", "--atomic",
+                "--output", "json"
             )
-            print("KEDA Helm chart installed successfully")
+            release = orjson.loads(stdout)
+            logger.info("KEDA Helm release '%s' is %s", release['name'], release['info']['status'])
 
-            # Verify KEDA operator is running
-            pods = self.core_v1.list_namespaced_pod(namespace=namespace, label_selector="app=keda-operator")
-            if not pods.items:
-                print("Error: KEDA operator pod not found")
-                return False
-            for pod in pods.items:
-                if pod.status.phase != "Running":
-                    print(f"Error: KEDA operator pod {pod.metadata.name} is not running")
-                    return False
-            print("KEDA operator is running")
-            return True
+            # Verify KEDA operator is running. A watch gets pushed pod updates from
+            # the apiserver, so we return at the moment the operator comes up
+            # instead of polling list_namespaced_pod in a loop.
+            async with watch.Watch().stream(self.core_v1.list_namespaced_pod, namespace=namespace,
+                                            label_selector="app=keda-operator",
+                                            timeout_seconds=120) as stream:
+                async for event in stream:
+                    pod = event['object']
+                    container_statuses = pod.status.container_statuses
+                    if pod.status.phase == _RUNNING and all(cs.ready for cs in container_statuses or []):
+                        logger.info("KEDA operator is running")
+                        return True
+            logger.error("KEDA operator pod did not become ready within 120s")
+            return False
         except subprocess.CalledProcessError as e:
-            print(f"Error installing KEDA: {e.stderr}")
+            logger.error("Error installing KEDA: %s", e.stderr)
             return False
         except ApiException as e:
-            print(f"Kubernetes API error: {str(e)}")
+            logger.error("Kubernetes API error: %s", e)
             return False
         except Exception as e:
-            print(f"Unexpected error installing KEDA: {str(e)}")
+            logger.error("Unexpected error installing KEDA: %s", e)
             return False
 
-    def create_deployment(self, config_file: str) -> Dict[str, Any]:
+    async def create_deployment(self, config_file: str, ensure_namespace: bool = True) -> Dict[str, Any]:
         """Create a Kubernetes deployment with KEDA ScaledObject based on a config file."""
         try:
             # Load and validate configuration
-            with open(config_file, 'r') as f:
-                config_data = yaml.safe_load(f)
-
-            required_fields = ['deployment_name', 'namespace', 'image', 'tag', 'cpu_request', 'cpu_limit',
-                              'memory_request', 'memory_limit', 'port', 'min_replicas', 'max_replicas',
-                              'scaler_type', 'scaler_config']
-            for field in required_fields:
-                if field not in config_data:
-                    raise ValueError(f"Missing required configuration field: {field}")
+            config_data = _load_config(config_file)
+            _validate_config(config_data)
 
             deployment_name = config_data['deployment_name']
             namespace = config_data['namespace']
 
-            # Create namespace if it doesn't exist
-            try:
-                self.core_v1.read_namespace(name=namespace)
-            except ApiException as e:
-                if e.status == 404:
-                    namespace_body = client.V1Namespace(metadata=client.V1ObjectMeta(name=namespace))
-                    self.core_v1.create_namespace(namespace_body)
-                    print(f"Created namespace: {namespace}")
-                else:
-                    raise e
-
-            # Create deployment
-            deployment = client.V1Deployment(
-                metadata=client.V1ObjectMeta(name=deployment_name, namespace=namespace),
-                spec=client.V1DeploymentSpec(
-                    replicas=config_data['min_replicas'],
-                    selector=client.V1LabelSelector(match_labels={"app": deployment_name}),
-                    template=client.V1PodTemplateSpec(
-                        metadata=client.V1ObjectMeta(labels={"app": deployment_name}),
-                        spec=client.V1PodSpec(
-                            containers=[
-                                client.V1Container(
-                                    name=deployment_name,
-                                    image=f"{config_data['image']}:{config_data['tag']}",
-                                    ports=[client.V1ContainerPort(container_port=config_data['port'])],
-                                    resources=client.V1ResourceRequirements(
-                                        requests={"cpu": config_data['cpu_request'], "memory": config_data['memory_request']},
-                                        limits={"cpu": config_data['cpu_limit'], "memory": config_data['memory_limit']}
-                                    ),
-                                    env=[
-                                        client.V1EnvVar(name=k, value=v) for k, v in config_data.get('env_vars', {}).items()
-                                    ]
-                                )
-                            ]
-                        )
-                    )
-                )
-            )
-            self.apps_v1.create_namespaced_deployment(namespace=namespace, body=deployment)
-            print(f"Deployment {deployment_name} created in namespace {namespace}")
-
-            # Create service
-            service = client.V1Service(
-                metadata=client.V1ObjectMeta(name=f"{deployment_name}-service", namespace=namespace),
-                spec=client.V1ServiceSpec(
-                    selector={"app": deployment_name},
-                    ports=[client.V1ServicePort(port=config_data['port'], target_port=config_data['port'])],
-                    type="ClusterIP"
-                )
-            )
-            self.core_v1.create_namespaced_service(namespace=namespace, body=service)
-            print(f"Service {deployment_name}-service created")
+            if ensure_namespace:
+                await self._ensure_namespace(namespace)
 
+            # Build (or fetch memoized) deployment and service bodies
+            env_items = tuple(config_data.get('env_vars', {}).items())
+            if config_data.get('readiness_webhook_url'):
+                env_items += (("READINESS_WEBHOOK_URL", config_data['readiness_webhook_url']),)
+            deployment = _build_deployment_body(
+                deployment_name, namespace, config_data['image'], config_data['tag'],
+                config_data['cpu_request'], config_data['cpu_limit'],
+                config_data['memory_request'], config_data['memory_limit'],
+                config_data['port'], config_data['min_replicas'], env_items
+            )
+            service = _build_service_body(deployment_name, namespace, config_data['port'])
             # Create KEDA ScaledObject
             scaled_object = {
                 "apiVersion": "keda.sh/v1alpha1",
@@ -174,11 +394,31 @@ class KubernetesAutomation:
                     ]
                 }
             }
-            self.custom_objects_api.create_namespaced_custom_object(
-                group="keda.sh", version="v1alpha1", namespace=namespace,
-                plural="scaledobjects", body=scaled_object
+            # The deployment, service and ScaledObject are independent, so create
+            # them concurrently: wall-clock cost is max(rtt) instead of 3*rtt.
+            kinds = ("deployment", "service", "scaledobject")
+            # _preload_content=False because the created objects echoed back by
+            # the apiserver are never read; _checked turns non-2xx responses
+            # back into ApiException since the raw path never raises itself.
+            results = await asyncio.gather(
+                _checked(self.apps_v1.create_namespaced_deployment(namespace=namespace, body=deployment,
+                                                                   _preload_content=False)),
+                _checked(self.core_v1.create_namespaced_service(namespace=namespace, body=service,
+                                                                _preload_content=False)),
+                _checked(self.custom_objects_api.create_namespaced_custom_object(
+                    group="keda.sh", version="v1alpha1", namespace=namespace,
+                    plural="scaledobjects", body=scaled_object, _preload_content=False
+                )),
+                return_exceptions=True
             )
-            print(f"KEDA ScaledObject {deployment_name}-scaler created")
+            errors = {kind: r for kind, r in zip(kinds, results) if isinstance(r, BaseException)}
+            if errors:
+                created = [kind for kind in kinds if kind not in errors]
+                await self._rollback_created(deployment_name, namespace, created)
+                raise next(iter(errors.values()))
+            logger.info("Deployment %s created in namespace %s", deployment_name, namespace)
+            logger.info("Service %s-service created", deployment_name)
+            logger.info("KEDA ScaledObject %s-scaler created", deployment_name)
 
             # Return deployment details
             return {
@@ -193,80 +433,245 @@ class KubernetesAutomation:
                 }
             }
         except FileNotFoundError:
-            print(f"Error: Configuration file {config_file} not found")
+            logger.error("Configuration file %s not found", config_file)
             return {}
-        except yaml.YAMLError:
-            print(f"Error: Invalid YAML in configuration file {config_file}")
+        except _YAML_ERRORS:
+            logger.error("Invalid YAML in configuration file %s", config_file)
             return {}
         except ApiException as e:
-            print(f"Kubernetes API error: {str(e)}")
+            logger.error("Kubernetes API error: %s", e)
             return {}
-        except ValueError as e:
-            print(f"Validation error: {str(e)}")
+        except fastjsonschema.JsonSchemaException as e:
+            logger.error("Validation error: %s", e.message)
             return {}
         except Exception as e:
-            print(f"Unexpected error creating deployment: {str(e)}")
+            logger.error("Unexpected error creating deployment: %s", e)
             return {}
 
-    def get_deployment_health(self, deployment_name: str, namespace: str) -> Dict[str, Any]:
+    async def create_deployments_batch(self, config_files) -> list:
+        """Deploy many configs concurrently, returning one result per input in order.
+
+        All jobs share the client connection pool, the compiled validator and
+        the parse/template caches. Namespace creation is deduplicated up front
+        so each unique namespace costs a single round trip, and the fan-out is
+        capped by a semaphore so a large batch doesn't stampede the apiserver.
+        Failures come back as exceptions in the result list instead of
+        cancelling sibling deploys.
+        """
+        namespaces = set()
+        for path in config_files:
+            try:
+                namespaces.add(_load_config(path)['namespace'])
+            except (OSError, KeyError, TypeError) + _YAML_ERRORS:
+                pass  # the per-config deploy below reports the real error
+        # An unauthorized or invalid namespace must not cancel the batch:
+        # log it here and let the affected deploys fail (and be reported)
+        # individually in the result list.
+        ensure_results = await asyncio.gather(
+            *(self._ensure_namespace(ns) for ns in namespaces), return_exceptions=True)
+        for ns, result in zip(namespaces, ensure_results):
+            if isinstance(result, BaseException):
+                logger.warning("Failed to ensure namespace %s: %s", ns, result)
+
+        semaphore = asyncio.Semaphore(8)
+
+        async def one(path):
+            async with semaphore:
+                return await self.create_deployment(path, ensure_namespace=False)
+
+        return await asyncio.gather(*(one(path) for path in config_files), return_exceptions=True)
+
+    async def _rollback_created(self, deployment_name: str, namespace: str, created) -> None:
+        """Best-effort cleanup of resources left behind by a partially failed create."""
+        for kind in created:
+            try:
+                if kind == "deployment":
+                    await _checked(self.apps_v1.delete_namespaced_deployment(
+                        name=deployment_name, namespace=namespace, _preload_content=False))
+                elif kind == "service":
+                    await _checked(self.core_v1.delete_namespaced_service(
+                        name=f"{deployment_name}-service", namespace=namespace, _preload_content=False))
+                elif kind == "scaledobject":
+                    await _checked(self.custom_objects_api.delete_namespaced_custom_object(
+                        group="keda.sh", version="v1alpha1", namespace=namespace,
+                        plural="scaledobjects", name=f"{deployment_name}-scaler",
+                        _preload_content=False
+                    ))
+                logger.info("Rolled back %s for %s", kind, deployment_name)
+            except ApiException as e:
+                logger.warning("Failed to roll back %s for %s: %s", kind, deployment_name, e)
+
+    async def get_deployment_health(self, deployment_name: str, namespace: str) -> Dict[str, Any]:
         """Check the health status of a deployment."""
         try:
-            deployment = self.apps_v1.read_namespaced_deployment(name=deployment_name, namespace=namespace)
-            status = deployment.status
-            pods = self.core_v1.list_namespaced_pod(namespace=namespace, label_selector=f"app={deployment_name}")
+            # Read the cheap status subresource first: if the deployment's
+            # resourceVersion hasn't moved since the previous call, nothing
+            # changed and the cached health dict is returned without the
+            # pod-list round trip — tight polling loops mostly hit this path.
+            # Raw orjson parsing skips the client's reflective model
+            # deserialization since only a handful of fields are touched.
+            dep_resp = await _checked(self.apps_v1.read_namespaced_deployment_status(
+                name=deployment_name, namespace=namespace, _preload_content=False))
+            dep = orjson.loads(await dep_resp.read())
+            cache_key = (deployment_name, namespace, dep['metadata']['resourceVersion'])
+            cached = self._health_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+            status = dep.get('status', {})
+            # The field selector drops completed pods server-side
+            pod_resp = await _checked(self.core_v1.list_namespaced_pod(
+                namespace=namespace, label_selector=f"app={deployment_name}",
+                field_selector="status.phase!=Succeeded", _preload_content=False))
+            pods = orjson.loads(await pod_resp.read()).get('items', [])
 
             health = {
                 "deployment_name": deployment_name,
                 "namespace": namespace,
-                "replicas": status.replicas,
-                "available_replicas": status.available_replicas or 0,
-                "ready_replicas": status.ready_replicas or 0,
+                "replicas": status.get('replicas'),
+                "available_replicas": status.get('availableReplicas', 0),
+                "ready_replicas": status.get('readyReplicas', 0),
                 "pod_statuses": [
                     {
-                        "pod_name": pod.metadata.name,
-                        "phase": pod.status.phase,
+                        "pod_name": pod['metadata']['name'],
+                        "phase": pod['status'].get('phase'),
                         "conditions": [
-                            {"type": c.type, "status": c.status} for c in pod.status.conditions or []
+                            {"type": c['type'], "status": c['status']}
+                            for c in pod['status'].get('conditions', [])
                         ]
-                    } for pod in pods.items
+                    } for pod in pods
                 ]
             }
-            print(f"Health status for deployment {deployment_name}: {json.dumps(health, indent=2)}")
+            self._health_cache[cache_key] = health
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Health status for deployment %s: %s", deployment_name,
+                            orjson.dumps(health, option=orjson.OPT_INDENT_2).decode())
             return health
         except ApiException as e:
-            print(f"Error checking deployment health: {str(e)}")
+            logger.error("Error checking deployment health: %s", e)
             return {}
         except Exception as e:
-            print(f"Unexpected error checking health: {str(e)}")
+            logger.error("Unexpected error checking health: %s", e)
             return {}
 
+    async def stream_deployment_health(self, deployment_name: str, namespace: str, on_ready,
+                                       timeout_seconds: int = 300) -> bool:
+        """Watch a deployment and invoke on_ready(health) once all replicas are ready.
+
+        Unlike polling get_deployment_health in a loop, this streams deployment
+        events from the apiserver, so the callback fires as soon as the rollout
+        completes instead of at the next poll tick.
+        """
+        try:
+            async with watch.Watch().stream(self.apps_v1.list_namespaced_deployment, namespace=namespace,
+                                            field_selector=f"metadata.name={deployment_name}",
+                                            timeout_seconds=timeout_seconds) as stream:
+                async for event in stream:
+                    status = event['object'].status
+                    if status.replicas and status.ready_replicas == status.replicas:
+                        on_ready({
+                            "deployment_name": deployment_name,
+                            "namespace": namespace,
+                            "replicas": status.replicas,
+                            "available_replicas": status.available_replicas or 0,
+                            "ready_replicas": status.ready_replicas or 0
+                        })
+                        return True
+            logger.error("Deployment %s did not become ready within %ss", deployment_name, timeout_seconds)
+            return False
+        except ApiException as e:
+            logger.error("Error watching deployment health: %s", e)
+            return False
+
+async def _serve(k8s: KubernetesAutomation) -> None:
+    """Stream newline-delimited JSON commands from stdin and answer on stdout.
+
+    Keeps the connected client — and every parse, template and health cache —
+    alive across commands, so each action after the first pays only the
+    apiserver round trip instead of interpreter startup, kubeconfig load and
+    TLS setup. Commands mirror the CLI actions:
+
+        {"action": "deploy", "config": "app.yaml"}
+        {"action": "deploy-batch", "configs": ["a.yaml", "b.yaml"]}
+        {"action": "health", "deployment": "my-app", "namespace": "default"}
+        {"action": "install"}
+
+    One JSON result is written per command; EOF ends the session.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        line = await loop.run_in_executor(None, sys.stdin.readline)
+        if not line:
+            break
+        if not line.strip():
+            continue
+        try:
+            cmd = orjson.loads(line)
+            action = cmd.get("action")
+            if action == "deploy":
+                result = await k8s.create_deployment(cmd["config"])
+            elif action == "deploy-batch":
+                results = await k8s.create_deployments_batch(cmd["configs"])
+                result = [{"error": str(r)} if isinstance(r, BaseException) else r for r in results]
+            elif action == "health":
+                result = await k8s.get_deployment_health(cmd["deployment"], cmd.get("namespace", "default"))
+            elif action == "install":
+                result = {"installed": await k8s.install_helm() and await k8s.install_keda()}
+            else:
+                result = {"error": f"unknown action: {action}"}
+        except (orjson.JSONDecodeError, KeyError, TypeError) as e:
+            result = {"error": f"invalid command: {e}"}
+        sys.stdout.buffer.write(orjson.dumps(result) + b"\n")
+        sys.stdout.buffer.flush()
+
 def main():
     """CLI entry point for Kubernetes automation script."""
     import argparse
+    logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO"),
+                        format="%(asctime)s %(levelname)s %(name)s: %(message)s")
     parser = argparse.ArgumentParser(description="Kubernetes Automation CLI for KEDA and Deployments")
     parser.add_argument("--kubeconfig", help="Path to kubeconfig file", default=None)
-    parser.add_argument("--action", choices=["install", "deploy", "health"], required=True,
-                        help="Action to perform: install tools, deploy, or check health")
+    parser.add_argument("--action", choices=["install", "deploy", "deploy-batch", "health", "serve"], required=True,
+                        help="Action to perform: install tools, deploy, deploy a batch, check health, "
+                             "or serve commands over stdin")
     parser.add_argument("--config", help="Path to deployment configuration file (for deploy action)")
+    parser.add_argument("--configs", nargs="+",
+                        help="Paths to deployment configuration files (for deploy-batch action)")
     parser.add_argument("--deployment", help="Deployment name (for health action)")
     parser.add_argument("--namespace", help="Namespace (for health action)", default="default")
 
     args = parser.parse_args()
-    k8s = KubernetesAutomation(args.kubeconfig)
-
-    if args.action == "install":
-        if k8s.install_helm():
-            k8s.install_keda()
-    elif args.action == "deploy":
-        if not args.config:
-            print("Error: --config is required for deploy action")
-            sys.exit(1)
-        k8s.create_deployment(args.config)
-    elif args.action == "health":
-        if not args.deployment:
-            print("Error: --deployment is required for health action")
-            sys.exit(1)
-        k8s.get_deployment_health(args.deployment, args.namespace)
+    asyncio.run(_run(args))
+
+async def _run(args) -> None:
+    """Dispatch the parsed CLI action on a connected client."""
+    k8s = await KubernetesAutomation.connect(args.kubeconfig)
+    try:
+        if args.action == "install":
+            if await k8s.install_helm():
+                await k8s.install_keda()
+        elif args.action == "deploy":
+            if not args.config:
+                logger.error("--config is required for deploy action")
+                sys.exit(1)
+            await k8s.create_deployment(args.config)
+        elif args.action == "deploy-batch":
+            if not args.configs:
+                logger.error("--configs is required for deploy-batch action")
+                sys.exit(1)
+            results = await k8s.create_deployments_batch(args.configs)
+            for path, result in zip(args.configs, results):
+                if isinstance(result, BaseException):
+                    logger.error("Deploy failed for %s: %s", path, result)
+        elif args.action == "health":
+            if not args.deployment:
+                logger.error("--deployment is required for health action")
+                sys.exit(1)
+            await k8s.get_deployment_health(args.deployment, args.namespace)
+        elif args.action == "serve":
+            await _serve(k8s)
+    finally:
+        await _close_api_client(k8s.api_client)
 
 if __name__ == "__main__":
     main()
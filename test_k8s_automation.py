@@ -0,0 +1,132 @@
+import os
+import unittest
+from unittest import mock
+
+import orjson
+
+from k8s_automation import KubernetesAutomation
+from kubernetes_asyncio.client.rest import ApiException
+
+_CONFIG_PATH = os.path.join(os.path.dirname(__file__), "deployment_config.yaml")
+
+
+class _FakeResponse:
+    """Minimal stand-in for the raw aiohttp response returned with _preload_content=False."""
+
+    def __init__(self, payload, status=200):
+        self._body = orjson.dumps(payload)
+        self.status = status
+        self.reason = "OK" if status < 300 else "Error"
+        self.headers = {}
+
+    async def read(self):
+        return self._body
+
+
+def _automation():
+    """Build a KubernetesAutomation around a dummy client; tests stub the API handles."""
+    return KubernetesAutomation(mock.Mock())
+
+
+class GetDeploymentHealthTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.k8s = _automation()
+        self.dep = {
+            "metadata": {"resourceVersion": "41"},
+            "status": {"replicas": 2, "availableReplicas": 2, "readyReplicas": 2},
+        }
+        self.pods = {
+            "items": [
+                {
+                    "metadata": {"name": "my-app-1"},
+                    "status": {"phase": "Running",
+                               "conditions": [{"type": "Ready", "status": "True"}]},
+                }
+            ]
+        }
+        self.k8s.apps_v1 = mock.Mock(
+            read_namespaced_deployment_status=mock.AsyncMock(
+                side_effect=lambda **kw: _FakeResponse(self.dep)))
+        self.k8s.core_v1 = mock.Mock(
+            list_namespaced_pod=mock.AsyncMock(
+                side_effect=lambda **kw: _FakeResponse(self.pods)))
+
+    async def test_builds_health_from_raw_responses(self):
+        health = await self.k8s.get_deployment_health("my-app", "default")
+        self.assertEqual(health["deployment_name"], "my-app")
+        self.assertEqual(health["ready_replicas"], 2)
+        self.assertEqual(health["pod_statuses"],
+                         [{"pod_name": "my-app-1", "phase": "Running",
+                           "conditions": [{"type": "Ready", "status": "True"}]}])
+
+    async def test_unchanged_resource_version_skips_pod_list(self):
+        first = await self.k8s.get_deployment_health("my-app", "default")
+        second = await self.k8s.get_deployment_health("my-app", "default")
+        self.assertIs(second, first)
+        self.k8s.core_v1.list_namespaced_pod.assert_awaited_once()
+
+    async def test_api_error_returns_empty_dict(self):
+        self.k8s.apps_v1.read_namespaced_deployment_status = mock.AsyncMock(
+            side_effect=lambda **kw: _FakeResponse({"message": "not found"}, status=404))
+        self.assertEqual(await self.k8s.get_deployment_health("gone", "default"), {})
+
+
+
+class CreateDeploymentRollbackTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.k8s = _automation()
+        self.k8s._ensure_namespace = mock.AsyncMock()
+        self.k8s.apps_v1 = mock.Mock(
+            create_namespaced_deployment=mock.AsyncMock(
+                side_effect=lambda **kw: _FakeResponse({}, status=201)),
+            delete_namespaced_deployment=mock.AsyncMock(
+                side_effect=lambda **kw: _FakeResponse({}, status=200)))
+        self.k8s.core_v1 = mock.Mock(
+            create_namespaced_service=mock.AsyncMock(
+                side_effect=lambda **kw: _FakeResponse({}, status=201)),
+            delete_namespaced_service=mock.AsyncMock(
+                side_effect=lambda **kw: _FakeResponse({}, status=200)))
+        self.k8s.custom_objects_api = mock.Mock(
+            create_namespaced_custom_object=mock.AsyncMock(
+                side_effect=lambda **kw: _FakeResponse({}, status=201)),
+            delete_namespaced_custom_object=mock.AsyncMock(
+                side_effect=lambda **kw: _FakeResponse({}, status=200)))
+
+    async def test_all_creates_succeeding_returns_details(self):
+        result = await self.k8s.create_deployment(_CONFIG_PATH)
+        self.assertEqual(result["deployment_name"], "my-app")
+        self.k8s.apps_v1.delete_namespaced_deployment.assert_not_awaited()
+
+    async def test_failed_sibling_rolls_back_created_resources(self):
+        self.k8s.core_v1.create_namespaced_service = mock.AsyncMock(
+            side_effect=lambda **kw: _FakeResponse({"message": "invalid"}, status=422))
+
+        result = await self.k8s.create_deployment(_CONFIG_PATH)
+
+        self.assertEqual(result, {})
+        self.k8s.apps_v1.delete_namespaced_deployment.assert_awaited_once()
+        self.k8s.custom_objects_api.delete_namespaced_custom_object.assert_awaited_once()
+        self.k8s.core_v1.delete_namespaced_service.assert_not_awaited()
+
+
+class EnsureNamespaceTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.k8s = _automation()
+
+    async def test_conflict_is_treated_as_success(self):
+        self.k8s.core_v1 = mock.Mock(create_namespace=mock.AsyncMock(
+            side_effect=lambda *a, **kw: _FakeResponse({"reason": "AlreadyExists"}, status=409)))
+        await self.k8s._ensure_namespace("default")  # must not raise
+
+    async def test_forbidden_raises(self):
+        self.k8s.core_v1 = mock.Mock(create_namespace=mock.AsyncMock(
+            side_effect=lambda *a, **kw: _FakeResponse({"reason": "Forbidden"}, status=403)))
+        with self.assertRaises(ApiException):
+            await self.k8s._ensure_namespace("locked-down")
+
+
+if __name__ == "__main__":
+    unittest.main()